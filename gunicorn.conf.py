@@ -0,0 +1,11 @@
+import os
+
+# Production server for Render: `gunicorn server:app` picks this file up.
+# Rollcall state lives in process memory, so keep a single worker; the work is
+# network-bound, so one gevent worker serves many concurrent requests.
+# (The gevent worker monkey-patches before server.py is imported.)
+bind = f"0.0.0.0:{os.environ.get('PORT', '5000')}"
+workers = 1
+worker_class = "gevent"
+worker_connections = 1000
+keepalive = 5
@@ -1,7 +1,27 @@
-from flask import Flask, request, jsonify
+import os
+
+# Opt-in gevent when not started via gunicorn's gevent worker (which patches on
+# its own): must run before anything imports socket/threading.
+if os.environ.get("USE_GEVENT"):
+    from gevent import monkey
+    monkey.patch_all()
+
+from flask import Flask, Response, request
+import orjson
 import time
 import requests
-import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import re
+import sys
+import bisect
+import heapq
+import queue
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import chain, zip_longest
 from math import ceil
 
 # =========================
@@ -10,82 +30,161 @@ from math import ceil
 TOKEN = os.environ.get("TELEGRAM_TOKEN")
 CHAT_ID = os.environ.get("TELEGRAM_CHAT_ID")
 SESSION_EXPIRE_SECONDS = 60 * 40  # 40 mins
+SESSION_SWEEP_SECONDS = SESSION_EXPIRE_SECONDS // 4  # how often expired lives are dropped
 PORT = 5000  # Render will override with $PORT
+EDIT_MIN_INTERVAL = 1.0  # min seconds between Telegram updates of the same live
+COL_WIDTH = 14  # Max chars per checklist column (adjust for mobile)
+TELEGRAM_WORKERS = 4  # worker threads sharing the HTTP pool; each live sticks to one
+
+# Telegram Bot API endpoints (token is fixed for the process lifetime)
+SEND_URL = f"https://api.telegram.org/bot{TOKEN}/sendMessage"
+EDIT_URL = f"https://api.telegram.org/bot{TOKEN}/editMessageText"
+DELETE_URL = f"https://api.telegram.org/bot{TOKEN}/deleteMessage"
+
+# sendMessage/editMessageText bodies only vary in message_id/text, so the constant
+# fields are serialised once (open object, trailing comma) and spliced per call.
+_MESSAGE_BODY_PREFIX = orjson.dumps(
+    {"chat_id": CHAT_ID, "parse_mode": "HTML", "disable_web_page_preview": True}
+)[:-1] + b","
+_DELETE_BODY_PREFIX = orjson.dumps({"chat_id": CHAT_ID})[:-1] + b","
+# sendMessage replies echo the whole message; we only need result.message_id,
+# which Telegram serialises first, so pull it out without decoding the rest.
+_MSG_ID_RE = re.compile(rb'"message_id":\s*(\d+)')
 
 # Fixed 10 devices in the order you want them displayed
 DEVICE_ORDER = []
-
-# In-memory state per live (keyed by normalized live name)
-# state = {
-#   live_key: {
-#       "title": str,                # first-seen, permanent display title
-#       "machines": set[str],        # which devices have checked in
-#       "last_update": float,        # timestamp
-#       "message_id": int|None       # Telegram message to EDIT (single message per live)
-#   }
-# }
-checklists = {}
+DEVICE_ORDER = [sys.intern(d) for d in DEVICE_ORDER]
+DEVICE_ORDER_SET = frozenset(DEVICE_ORDER)
+
+# In-memory state per live, keyed by normalized live name in `checklists`.
+# Slotted: no per-instance __dict__ and fixed-offset attribute access.
+@dataclass(slots=True)
+class LiveState:
+    title: str                       # first-seen, permanent display title
+    last_update: int                 # time.monotonic_ns() of the latest check-in
+    machines: set[str] = field(default_factory=set)  # which devices have checked in
+    sorted_machines: list[tuple[str, str]] = field(default_factory=list)  # (name.lower(), name), kept sorted
+    message_id: int | None = None    # Telegram message to EDIT (single message per live)
+    last_sent_at: float = float("-inf")  # _now() when we last called Telegram for this live
+    text_hash: int | None = None     # hash() of the text Telegram currently shows
+
+checklists: dict[str, LiveState] = {}
+
+# Per-live locks guarding read-modify-write of a live's state; one lock per key
+# so concurrent check-ins for different lives don't serialise on each other.
+_locks: dict[str, threading.Lock] = {}
+_locks_guard = threading.Lock()
 
 app = Flask(__name__)
 
-def _now() -> float:
-    return time.time()
+# Shared HTTP session so every Telegram call reuses pooled keep-alive connections
+# instead of paying a fresh TCP+TLS handshake. Retry only covers connect errors
+# and idempotent methods by default, so a POST is never sent twice.
+_session = requests.Session()
+_adapter = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=20,
+    max_retries=Retry(total=3, backoff_factor=0.2, status_forcelist=[429, 500, 502, 503, 504]),
+)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+# Every call posts a pre-encoded JSON body. Telegram replies are a few KB at most,
+# so inflating gzip costs more CPU than it saves on the wire.
+_session.headers.update({
+    "Accept-Encoding": "identity",
+    "Connection": "keep-alive",
+    "Content-Type": "application/json",
+})
+
+# Monotonic clocks: immune to NTP/wall-clock jumps. Seconds for the edit debounce,
+# integer nanoseconds for session expiry (checked on every rollcall).
+_now = time.monotonic
+_now_ns = time.monotonic_ns
+_EXPIRE_NS = SESSION_EXPIRE_SECONDS * 1_000_000_000
 
 def _norm(s: str) -> str:
     return (s or "").strip().lower()
 
-def _render_checklist_text(title: str, machines: set[str]) -> str:
+@contextmanager
+def _lock_for(live_key: str):
+    """Hold live_key's lock. Retries if the sweeper retired the lock while we waited on it."""
+    while True:
+        with _locks_guard:
+            lock = _locks.setdefault(live_key, threading.Lock())
+        lock.acquire()
+        if _locks.get(live_key) is lock:
+            break
+        lock.release()
+    try:
+        yield
+    finally:
+        lock.release()
+
+# Every endpoint answers with one of these fixed bodies; encode them once at import
+_INVALID_JSON_BODY = orjson.dumps({"error": "Invalid JSON"})
+_MISSING_ROLLCALL_BODY = orjson.dumps({"error": "Missing username or machine"})
+_DUPLICATE_BODY = orjson.dumps({"status": "duplicate"})
+_OK_BODY = orjson.dumps({"status": "ok"})
+_MISSING_USERNAME_BODY = orjson.dumps({"error": "Missing username"})
+_LOGOUT_SENT_BODY = orjson.dumps({"status": "logout_warning_sent"})
+_BAN_SENT_BODY = orjson.dumps({"status": "ban_warning_sent"})
+_CODE_SENT_BODY = orjson.dumps({"status": "code_sent"})
+_MISSING_WINNER_BODY = orjson.dumps({"error": "Missing username or money"})
+_WINNER_SENT_BODY = orjson.dumps({"status": "winner_sent"})
+_ALIVE_BODY = orjson.dumps({"status": "alive"})
+
+def _json_response(body: bytes, status: int) -> Response:
+    """Response for a pre-encoded JSON body (skips jsonify's encoder/app-context machinery)."""
+    return Response(body, status=status, mimetype="application/json")
+
+@lru_cache(maxsize=4096)
+def _wrap_cell(mark: str, name: str) -> tuple[str, ...]:
+    """
+    Wrap a cell into multiple lines, mark on first line only.
+    Cached: a device's lines only change when its mark flips.
+    """
+    # First line has the mark
+    first_line_space = COL_WIDTH - 2  # "✅ " takes ~2 chars visually
+    if len(name) <= first_line_space:
+        return (f"{mark} {name}",)
+    # Wrap the name
+    result = [f"{mark} {name[:first_line_space]}"]
+    remaining = name[first_line_space:]
+    while remaining:
+        chunk = remaining[:COL_WIDTH]
+        result.append(f"   {chunk}")  # Indent continuation
+        remaining = remaining[COL_WIDTH:]
+    return tuple(result)
+
+def _render_checklist_text(title: str, machines: set[str], sorted_machines: list[tuple[str, str]]) -> str:
     """
     Build a clean, two-column checklist for the 10 devices.
     Unknown devices (not in DEVICE_ORDER) appear at the bottom.
+    `sorted_machines` is the live's pre-sorted (lowercase, name) list.
     """
-    # Base devices (fixed order)
-    ordered = list(DEVICE_ORDER)
-    # Any extra devices not in DEVICE_ORDER appear (sorted) after
-    extras = sorted([m for m in machines if m not in DEVICE_ORDER], key=str.lower)
-    display = ordered + extras
+    # Base devices (fixed order), then any extra devices not in DEVICE_ORDER (already sorted)
+    extras = (m for _, m in sorted_machines if m not in DEVICE_ORDER_SET)
 
     # Build cells with check mark or empty box
     cells = []
-    for name in display:
+    for name in chain(DEVICE_ORDER, extras):
         mark = "✅" if name in machines else "☐"
         cells.append((mark, name))
 
     # Two-column layout with fixed width and text wrapping
-    COL_WIDTH = 14  # Max chars per column (adjust for mobile)
     cols = 2
     rows = ceil(len(cells) / cols)
-    
-    def wrap_cell(mark: str, name: str, width: int) -> list[str]:
-        """Wrap a cell into multiple lines, mark on first line only."""
-        # First line has the mark
-        first_line_space = width - 2  # "✅ " takes ~2 chars visually
-        result = []
-        if len(name) <= first_line_space:
-            result.append(f"{mark} {name}")
-        else:
-            # Wrap the name
-            result.append(f"{mark} {name[:first_line_space]}")
-            remaining = name[first_line_space:]
-            while remaining:
-                chunk = remaining[:width]
-                result.append(f"   {chunk}")  # Indent continuation
-                remaining = remaining[width:]
-        return result
-    
+
     output_lines = []
     for r in range(rows):
         left_idx = r
         right_idx = r + rows
-        
-        left_lines = wrap_cell(*cells[left_idx], COL_WIDTH) if left_idx < len(cells) else [""]
-        right_lines = wrap_cell(*cells[right_idx], COL_WIDTH) if right_idx < len(cells) else [""]
-        
+
+        left_lines = _wrap_cell(*cells[left_idx]) if left_idx < len(cells) else ("",)
+        right_lines = _wrap_cell(*cells[right_idx]) if right_idx < len(cells) else ("",)
+
         # Combine left and right, padding to align columns
-        max_lines = max(len(left_lines), len(right_lines))
-        for i in range(max_lines):
-            left = left_lines[i] if i < len(left_lines) else ""
-            right = right_lines[i] if i < len(right_lines) else ""
+        for left, right in zip_longest(left_lines, right_lines, fillvalue=""):
             output_lines.append(f"{left:<{COL_WIDTH + 2}}{right}")
 
     grid = "\n".join(output_lines) if output_lines else "(no devices yet)"
@@ -95,34 +194,35 @@ def _render_checklist_text(title: str, machines: set[str]) -> str:
 
 def _telegram_send(text: str) -> int | None:
     """Send a new Telegram message. Return message_id or None on failure."""
-    url = f"https://api.telegram.org/bot{TOKEN}/sendMessage"
-    payload = {"chat_id": CHAT_ID, "text": text, "parse_mode": "HTML", "disable_web_page_preview": True}
+    body = _MESSAGE_BODY_PREFIX + b'"text":' + orjson.dumps(text) + b"}"
     try:
-        r = requests.post(url, json=payload, timeout=15)
+        r = _session.post(SEND_URL, data=body, timeout=15)
         r.raise_for_status()
-        data = r.json()
-        if data.get("ok") and "message_id" in data.get("result", {}):
-            return data["result"]["message_id"]
+        content = r.content
+        m = _MSG_ID_RE.search(content) if b'"ok":true' in content[:32] else None
+        if m:
+            return int(m.group(1))
         else:
-            print("Telegram send failed payload:", data)
+            print("Telegram send failed payload:", content)
     except Exception as e:
         print(f"Error sending to Telegram: {e}")
     return None
 
 def _telegram_edit(message_id: int, text: str) -> bool:
     """Edit an existing Telegram message. Return True on success."""
-    url = f"https://api.telegram.org/bot{TOKEN}/editMessageText"
-    payload = {
-        "chat_id": CHAT_ID,
-        "message_id": message_id,
-        "text": text,
-        "parse_mode": "HTML",
-        "disable_web_page_preview": True
-    }
+    body = (
+        _MESSAGE_BODY_PREFIX
+        + b'"message_id":' + str(message_id).encode()
+        + b',"text":' + orjson.dumps(text) + b"}"
+    )
     try:
-        r = requests.post(url, json=payload, timeout=15)
+        r = _session.post(EDIT_URL, data=body, timeout=15)
         if r.status_code == 200:
             return True
+        # Text already matches (e.g. an earlier edit landed but its reply was lost):
+        # the message is fine as-is, so don't replace it with a new one
+        if r.status_code == 400 and b"message is not modified" in r.content:
+            return True
         # Log error for visibility
         try:
             print("Edit failed:", r.status_code, r.text)
@@ -134,84 +234,190 @@ def _telegram_edit(message_id: int, text: str) -> bool:
 
 def _telegram_delete(message_id: int) -> None:
     """Best-effort delete of an old message (used only on replacement)."""
-    url = f"https://api.telegram.org/bot{TOKEN}/deleteMessage"
-    payload = {"chat_id": CHAT_ID, "message_id": message_id}
+    body = _DELETE_BODY_PREFIX + b'"message_id":' + str(message_id).encode() + b"}"
     try:
-        requests.post(url, json=payload, timeout=10)
+        _session.post(DELETE_URL, data=body, timeout=5)
     except Exception as e:
         print(f"Delete failed (ignored): {e}")
 
 def _update_single_message(live_key: str) -> None:
     """Ensure exactly one message per live: EDIT when possible, SEND once if needed, delete old if replaced."""
-    state = checklists[live_key]
-    text = _render_checklist_text(state["title"], state["machines"])
+    with _lock_for(live_key):
+        state = checklists.get(live_key)
+        if state is None:
+            return  # session expired and was swept
+        text = _render_checklist_text(state.title, state.machines, state.sorted_machines)
+
+    # Telegram rejects no-op edits (MESSAGE_NOT_MODIFIED); don't spend a round-trip on them
+    h = hash(text)
+    if h == state.text_hash:
+        return
+    state.last_sent_at = _now()
 
     # Try edit first if we have a message_id
-    if state.get("message_id"):
-        if _telegram_edit(state["message_id"], text):
+    if state.message_id:
+        if _telegram_edit(state.message_id, text):
+            state.text_hash = h
             return
         # If edit fails (deleted message, etc.), fall through to send new and delete old.
 
     # Send new message
-    old_id = state.get("message_id")
+    old_id = state.message_id
     new_id = _telegram_send(text)
     if new_id:
-        state["message_id"] = new_id
+        state.message_id = new_id
+        state.text_hash = h
         if old_id and old_id != new_id:
             _telegram_delete(old_id)
 
+# =========================
+# BACKGROUND TELEGRAM WORKER
+# =========================
+# /rollcall only mutates state and enqueues the live_key; worker threads do the
+# Telegram round-trips over the pooled session. Lives are sharded by key so one
+# slow edit doesn't hold up other lives, while each live is still handled by a
+# single thread (no concurrent send/edit races on its message_id). A key sits in _dirty from enqueue until the worker
+# starts on it, so a burst of check-ins collapses into one or two edits.
+# Lives updated less than EDIT_MIN_INTERVAL ago are parked on the worker's own
+# timer heap (still marked dirty) instead of hitting Telegram's edit rate limit.
+_work_qs: list["queue.Queue[str]"] = [queue.Queue() for _ in range(TELEGRAM_WORKERS)]
+_dirty: set[str] = set()
+_dirty_lock = threading.Lock()
+
+def _enqueue_update(live_key: str) -> None:
+    """Schedule a message refresh for live_key unless one is already pending."""
+    with _dirty_lock:
+        if live_key in _dirty:
+            return
+        _dirty.add(live_key)
+    _work_qs[hash(live_key) % TELEGRAM_WORKERS].put(live_key)
+
+def _telegram_worker(work_q: "queue.Queue[str]") -> None:
+    deferred: list[tuple[float, str]] = []  # heap of (due_at, live_key)
+    while True:
+        if deferred and deferred[0][0] <= _now():
+            live_key = heapq.heappop(deferred)[1]
+        else:
+            timeout = max(0.0, deferred[0][0] - _now()) if deferred else None
+            try:
+                live_key = work_q.get(timeout=timeout)
+            except queue.Empty:
+                continue
+            state = checklists.get(live_key)
+            if state is not None:
+                elapsed = _now() - state.last_sent_at
+                if elapsed < EDIT_MIN_INTERVAL:
+                    heapq.heappush(deferred, (_now() + EDIT_MIN_INTERVAL - elapsed, live_key))
+                    continue
+
+        with _dirty_lock:
+            _dirty.discard(live_key)
+        try:
+            _update_single_message(live_key)
+        except Exception as e:
+            print(f"Worker failed to update '{live_key}': {e}")
+
+for _i, _q in enumerate(_work_qs):
+    threading.Thread(target=_telegram_worker, args=(_q,), name=f"telegram-worker-{_i}", daemon=True).start()
+
+# One-off alerts (logout/ban/code/winner) go through their own FIFO thread so the
+# endpoints never wait on Telegram and alerts keep their arrival order.
+_notify_q: "queue.Queue[str]" = queue.Queue()
+
+def _enqueue_notification(text: str) -> None:
+    _notify_q.put(text)
+
+def _notification_worker() -> None:
+    while True:
+        text = _notify_q.get()
+        _telegram_send(text)  # logs its own failures
+
+threading.Thread(target=_notification_worker, name="telegram-notifier", daemon=True).start()
+
+# =========================
+# SESSION SWEEPER
+# =========================
+# Lives are otherwise only replaced when the same username checks in again, so
+# without this ghost sessions (and their locks) would pile up forever.
+def _sweep_expired_sessions() -> None:
+    cutoff = _now_ns() - _EXPIRE_NS
+    for live_key, state in list(checklists.items()):
+        if state.last_update > cutoff:
+            continue
+        with _lock_for(live_key):
+            state = checklists.get(live_key)
+            if state is not None and state.last_update <= cutoff:
+                del checklists[live_key]
+
+    # Retire locks whose live is gone; a thread about to take one notices and retries
+    with _locks_guard:
+        for live_key, lock in list(_locks.items()):
+            if live_key not in checklists and not lock.locked():
+                del _locks[live_key]
+
+def _session_sweeper() -> None:
+    while True:
+        time.sleep(SESSION_SWEEP_SECONDS)
+        try:
+            _sweep_expired_sessions()
+        except Exception as e:
+            print(f"Session sweep failed: {e}")
+
+threading.Thread(target=_session_sweeper, name="session-sweeper", daemon=True).start()
+
 @app.route("/rollcall", methods=["POST"])
 def rollcall():
     # Parse JSON
     try:
-        data = request.get_json(force=True)
+        data = orjson.loads(request.get_data(cache=False))
     except Exception:
-        return jsonify({"error": "Invalid JSON"}), 400
+        return _json_response(_INVALID_JSON_BODY, 400)
 
-    username = (data.get("username") or "").strip()
-    machine_name = (data.get("machine") or "").strip()
+    # Interned: the same few live/device names arrive on every check-in, so
+    # long-lived state shares one object per name (and set lookups hit by identity)
+    username = sys.intern((data.get("username") or "").strip())
+    machine_name = sys.intern((data.get("machine") or "").strip())
 
     if not username or not machine_name:
-        return jsonify({"error": "Missing username or machine"}), 400
-
-    live_key = _norm(username)
-    now = _now()
-
-    state = checklists.get(live_key)
-    # Start/refresh session if none or expired
-    if (state is None) or ((now - state.get("last_update", 0)) >= SESSION_EXPIRE_SECONDS):
-        state = {
-            "title": username,       # permanent first-seen display name
-            "machines": set(),
-            "last_update": now,
-            "message_id": None
-        }
-        checklists[live_key] = state
-
-    # Dedupe per machine
-    if machine_name in state["machines"]:
-        # Still update timestamp to keep the session alive
-        state["last_update"] = now
-        return jsonify({"status": "duplicate"}), 200
-
-    # Track new machine and update the single Telegram message
-    state["machines"].add(machine_name)
-    state["last_update"] = now
-    _update_single_message(live_key)
-
-    return jsonify({"status": "ok"}), 200
+        return _json_response(_MISSING_ROLLCALL_BODY, 400)
+
+    live_key = sys.intern(_norm(username))
+    now = _now_ns()
+
+    with _lock_for(live_key):
+        state = checklists.get(live_key)
+        # Start/refresh session if none or expired
+        if (state is None) or ((now - state.last_update) >= _EXPIRE_NS):
+            state = LiveState(title=username, last_update=now)
+            checklists[live_key] = state
+
+        # Dedupe per machine
+        if machine_name in state.machines:
+            # Still update timestamp to keep the session alive
+            state.last_update = now
+            return _json_response(_DUPLICATE_BODY, 200)
+
+        # Track new machine
+        state.machines.add(machine_name)
+        bisect.insort(state.sorted_machines, (machine_name.lower(), machine_name))
+        state.last_update = now
+
+    # Update the single Telegram message (off the request thread)
+    _enqueue_update(live_key)
+
+    return _json_response(_OK_BODY, 200)
 
 @app.route("/logout", methods=["POST"])
 def logout():
 
     try:
-        data = request.get_json(force=True)
+        data = orjson.loads(request.get_data(cache=False))
     except Exception:
-        return jsonify({"error": "Invalid JSON"}), 400
+        return _json_response(_INVALID_JSON_BODY, 400)
 
     username = (data.get("username") or "").strip()
     if not username:
-        return jsonify({"error": "Missing username"}), 400
+        return _json_response(_MISSING_USERNAME_BODY, 400)
 
     username = _norm(username)
 
@@ -219,17 +425,17 @@ def logout():
 
     # Send a separate warning message to Telegram
     warning_text = f"⚠️ Tài khoản <b>{username}</b> bị đăng xuất."
-    _telegram_send(warning_text)
+    _enqueue_notification(warning_text)
 
-    print(f"Logout warning sent for '{username}'.")
-    return jsonify({"status": "logout_warning_sent"}), 200
+    print(f"Logout warning queued for '{username}'.")
+    return _json_response(_LOGOUT_SENT_BODY, 200)
 
 @app.route("/banned", methods=["POST"])
 def banned():
     try:
-        data = request.get_json(force=True)
+        data = orjson.loads(request.get_data(cache=False))
     except Exception:
-        return jsonify({"error": "Invalid JSON"}), 400
+        return _json_response(_INVALID_JSON_BODY, 400)
 
     # We don't strictly need a username, but it helps if the extension sends it
     # If not sent, we can just say "A bot was banned"
@@ -238,17 +444,17 @@ def banned():
     
     # Send a critical warning message to Telegram
     ban_text = f"🚨Tài khoản <b>{username}</b> đã bị cấm dùng."
-    _telegram_send(ban_text)
+    _enqueue_notification(ban_text)
 
-    print(f"BAN warning sent for '{username}'.")
-    return jsonify({"status": "ban_warning_sent"}), 200
+    print(f"BAN warning queued for '{username}'.")
+    return _json_response(_BAN_SENT_BODY, 200)
 
 @app.route("/code", methods=["POST"])
 def code_endpoint():
     try:
-        data = request.get_json(force=True)
+        data = orjson.loads(request.get_data(cache=False))
     except Exception:
-        return jsonify({"error": "Invalid JSON"}), 400
+        return _json_response(_INVALID_JSON_BODY, 400)
 
     code = (data.get("code") or "").strip()
     website = (data.get("website") or "").strip()
@@ -264,39 +470,39 @@ def code_endpoint():
     else:
         code_text = f"🎁 CODE MỚI: <code>{code}</code>\n📍 WEB: {website}"
 
-    _telegram_send(code_text)
+    _enqueue_notification(code_text)
 
-    print(f"Code notification sent: '{code}'")
-    return jsonify({"status": "code_sent"}), 200
+    print(f"Code notification queued: '{code}'")
+    return _json_response(_CODE_SENT_BODY, 200)
 # =================================================================
 
 @app.route("/winner", methods=["POST"])
 def winner():
     try:
-        data = request.get_json(force=True)
+        data = orjson.loads(request.get_data(cache=False))
     except Exception:
-        return jsonify({"error": "Invalid JSON"}), 400
+        return _json_response(_INVALID_JSON_BODY, 400)
 
     username = (data.get("username") or "").strip()
     money = (data.get("money") or "").strip()
 
     if not username or not money:
-        return jsonify({"error": "Missing username or money"}), 400
+        return _json_response(_MISSING_WINNER_BODY, 400)
 
     username = _norm(username)
     money = _norm(money)
 
     # Build winner message
     winner_text = f"💲 Tài khoản <b>{username}</b> trúng thưởng <b>{money}</b>."
-    _telegram_send(winner_text)
+    _enqueue_notification(winner_text)
 
-    print(f"Winner message sent for '{username}' with prize '{money}'.")
-    return jsonify({"status": "winner_sent"}), 200
+    print(f"Winner message queued for '{username}' with prize '{money}'.")
+    return _json_response(_WINNER_SENT_BODY, 200)
 
 
 @app.route("/api/healthcheck")
 def healthcheck():
-    return jsonify({"status": "alive"}), 200
+    return _json_response(_ALIVE_BODY, 200)
 
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port=int(os.environ.get("PORT", PORT)))